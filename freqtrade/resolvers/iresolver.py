@@ -73,7 +73,11 @@ class IResolver:
 
     @classmethod
     def _get_valid_object(
-        cls, module_path: Path, object_name: Optional[str], enum_failed: bool = False
+        cls,
+        module_path: Path,
+        object_name: Optional[str],
+        enum_failed: bool = False,
+        failed_modules: Optional[List[Path]] = None,
     ) -> Iterator[Any]:
         """
         Generator returning objects with matching object_type and object_name in the path given.
@@ -81,6 +85,7 @@ class IResolver:
         :param object_name: Class name of the object
         :param enum_failed: If True, will return None for modules which fail.
             Otherwise, failing modules are skipped.
+        :param failed_modules: If given, modules which fail to import are appended to this list
         :return: generator containing tuple of matching objects
              Tuple format: [Object, source]
         """
@@ -105,6 +110,8 @@ class IResolver:
             ) as err:
                 # Catch errors in case a specific module is not installed
                 logger.warning(f"Could not import {module_path} due to '{err}'")
+                if failed_modules is not None:
+                    failed_modules.append(module_path)
                 if enum_failed:
                     return iter([None])
 
@@ -123,12 +130,18 @@ class IResolver:
 
     @classmethod
     def _search_object(
-        cls, directory: Path, *, object_name: str, add_source: bool = False
+        cls,
+        directory: Path,
+        *,
+        object_name: str,
+        add_source: bool = False,
+        failed_modules: Optional[List[Path]] = None,
     ) -> Union[Tuple[Any, Path], Tuple[None, None]]:
         """
         Search for the objectname in the given directory
         :param directory: relative or absolute directory path
         :param object_name: ClassName of the object to load
+        :param failed_modules: If given, modules which fail to import are appended to this list
         :return: object class
         """
         logger.debug(f"Searching for {cls.object_type.__name__} {object_name} in '{directory}'")
@@ -140,29 +153,67 @@ class IResolver:
             if entry.is_symlink() and not entry.is_file():
                 logger.debug("Ignoring broken symlink %s", entry)
                 continue
-            module_path = entry.resolve()
-
-            obj = next(cls._get_valid_object(module_path, object_name), None)
-
+            obj = cls._search_object_file(
+                entry,
+                object_name=object_name,
+                add_source=add_source,
+                failed_modules=failed_modules,
+            )
             if obj:
-                obj[0].__file__ = str(entry)
-                if add_source:
-                    obj[0].__source__ = obj[1]
-                return (obj[0], module_path)
+                return (obj, entry.resolve())
         return (None, None)
 
+    @classmethod
+    def _search_object_file(
+        cls,
+        entry: Path,
+        *,
+        object_name: str,
+        add_source: bool = False,
+        failed_modules: Optional[List[Path]] = None,
+    ) -> Optional[Any]:
+        """
+        Search for the objectname in the given python file
+        :param entry: path to the python file
+        :param object_name: ClassName of the object to load
+        :param failed_modules: If given, modules which fail to import are appended to this list
+        :return: object class or None
+        """
+        module_path = entry.resolve()
+
+        obj = next(
+            cls._get_valid_object(module_path, object_name, failed_modules=failed_modules), None
+        )
+
+        if obj:
+            obj[0].__file__ = str(entry)
+            if add_source:
+                obj[0].__source__ = obj[1]
+            return obj[0]
+        return None
+
     @classmethod
     def _load_object(
-        cls, paths: List[Path], *, object_name: str, add_source: bool = False, kwargs: Dict
+        cls,
+        paths: List[Path],
+        *,
+        object_name: str,
+        add_source: bool = False,
+        kwargs: Dict,
+        failed_modules: Optional[List[Path]] = None,
     ) -> Optional[Any]:
         """
         Try to load object from path list.
+        :param failed_modules: If given, modules which fail to import are appended to this list
         """
 
         for _path in paths:
             try:
                 (module, module_path) = cls._search_object(
-                    directory=_path, object_name=object_name, add_source=add_source
+                    directory=_path,
+                    object_name=object_name,
+                    add_source=add_source,
+                    failed_modules=failed_modules,
                 )
                 if module:
                     logger.info(
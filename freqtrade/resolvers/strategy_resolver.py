@@ -5,12 +5,12 @@ This module load custom strategies
 """
 
 import logging
-import tempfile
-from base64 import urlsafe_b64decode
+from copy import deepcopy
 from inspect import getfullargspec
+from operator import itemgetter
 from os import walk
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from freqtrade.configuration.config_validation import validate_migrated_strategy_settings
 from freqtrade.constants import REQUIRED_ORDERTIF, REQUIRED_ORDERTYPES, USERPATH_STRATEGIES, Config
@@ -22,6 +22,58 @@ from freqtrade.strategy.interface import IStrategy
 
 logger = logging.getLogger(__name__)
 
+# Strategy files resolved previously, keyed by (strategy name, search paths).
+# Values are the strategy file and the state of the search paths up to (and including)
+# the directory of this file - so strategies added to earlier search paths are not missed.
+# Only the location is cached - the module is executed again on every load, so every
+# strategy instance gets a fresh class (hyperoptable parameters live on the class).
+_STRATEGY_CACHE: Dict[
+    Tuple[str, Tuple[Path, ...]], Tuple[Path, Tuple[Tuple[str, int, int], ...]]
+] = {}
+# Strategies which could not be found, keyed like _STRATEGY_CACHE.
+# Values are the state of the search paths at the time of the failed search.
+# Only searches where all modules imported successfully are cached - a failing import
+# may be caused by a dependency which becomes available later.
+_MISSING_CACHE: Dict[Tuple[str, Tuple[Path, ...]], Tuple[Tuple[str, int, int], ...]] = {}
+_MISSING_CACHE_SIZE = 32
+# Temporary directories of base64 encoded strategies, keyed by hash of name and payload.
+# All directories are created within one temporary directory, removed on exit.
+_B64_TEMP_CACHE: Dict[str, Path] = {}
+_B64_TEMP_ROOT: Optional[Path] = None
+
+# Sentinel for attributes which are not defined on the strategy
+_MISSING: Any = object()
+
+# Strategy attributes which can be overridden by the configuration
+#     (Attribute name,                    default)
+_STRATEGY_ATTRIBUTES: Tuple[Tuple[str, Any], ...] = (
+    ("minimal_roi", {"0": 10.0}),
+    ("timeframe", None),
+    ("stoploss", None),
+    ("trailing_stop", None),
+    ("trailing_stop_positive", None),
+    ("trailing_stop_positive_offset", 0.0),
+    ("trailing_only_offset_is_reached", None),
+    ("use_custom_stoploss", None),
+    ("process_only_new_candles", None),
+    ("order_types", None),
+    ("order_time_in_force", None),
+    ("stake_currency", None),
+    ("stake_amount", None),
+    ("protections", None),
+    ("startup_candle_count", None),
+    ("unfilledtimeout", None),
+    ("use_exit_signal", True),
+    ("exit_profit_only", False),
+    ("ignore_roi_if_entry_signal", False),
+    ("exit_profit_offset", 0.0),
+    ("disable_dataframe_checks", False),
+    ("ignore_buying_expired_candle_after", 0),
+    ("position_adjustment_enable", False),
+    ("max_entry_position_adjustment", -1),
+    ("max_open_trades", -1),
+)
+
 
 class StrategyResolver(IResolver):
     """
@@ -54,41 +106,18 @@ class StrategyResolver(IResolver):
         strategy.ft_load_params_from_file()
         # Set attributes
         # Check if we need to override configuration
-        #             (Attribute name,                    default,     subkey)
-        attributes = [
-            ("minimal_roi", {"0": 10.0}),
-            ("timeframe", None),
-            ("stoploss", None),
-            ("trailing_stop", None),
-            ("trailing_stop_positive", None),
-            ("trailing_stop_positive_offset", 0.0),
-            ("trailing_only_offset_is_reached", None),
-            ("use_custom_stoploss", None),
-            ("process_only_new_candles", None),
-            ("order_types", None),
-            ("order_time_in_force", None),
-            ("stake_currency", None),
-            ("stake_amount", None),
-            ("protections", None),
-            ("startup_candle_count", None),
-            ("unfilledtimeout", None),
-            ("use_exit_signal", True),
-            ("exit_profit_only", False),
-            ("ignore_roi_if_entry_signal", False),
-            ("exit_profit_offset", 0.0),
-            ("disable_dataframe_checks", False),
-            ("ignore_buying_expired_candle_after", 0),
-            ("position_adjustment_enable", False),
-            ("max_entry_position_adjustment", -1),
-            ("max_open_trades", -1),
-        ]
-        for attribute, default in attributes:
-            StrategyResolver._override_attribute_helper(strategy, config, attribute, default)
-
-        # Loop this list again to have output combined
-        for attribute, _ in attributes:
-            if attribute in config:
-                logger.info("Strategy using %s: %s", attribute, config[attribute])
+        log_attributes = logger.isEnabledFor(logging.INFO)
+        used_attributes: List[Tuple[str, Any]] = []
+        for attribute, default in _STRATEGY_ATTRIBUTES:
+            StrategyResolver._override_attribute_helper(
+                strategy, config, attribute, default, log_override=log_attributes
+            )
+            if log_attributes and attribute in config:
+                used_attributes.append((attribute, config[attribute]))
+
+        # Log after all overrides to have output combined
+        for attribute, value in used_attributes:
+            logger.info("Strategy using %s: %s", attribute, value)
 
         StrategyResolver._normalize_attributes(strategy)
 
@@ -96,37 +125,44 @@ class StrategyResolver(IResolver):
         return strategy
 
     @staticmethod
-    def _override_attribute_helper(strategy, config: Config, attribute: str, default: Any):
+    def _override_attribute_helper(
+        strategy, config: Config, attribute: str, default: Any, log_override: bool = True
+    ):
         """
         Override attributes in the strategy.
         Prevalence:
         - Configuration
         - Strategy
         - default (if not None)
+        :param log_override: Log overrides from the configuration (skip if INFO is disabled)
         """
         if attribute in config and not isinstance(
             getattr(type(strategy), attribute, None), property
         ):
             # Ensure Properties are not overwritten
             setattr(strategy, attribute, config[attribute])
-            logger.info(
-                "Override strategy '%s' with value in config file: %s.",
-                attribute,
-                config[attribute],
-            )
-        elif hasattr(strategy, attribute):
-            val = getattr(strategy, attribute)
+            if log_override:
+                logger.info(
+                    "Override strategy '%s' with value in config file: %s.",
+                    attribute,
+                    config[attribute],
+                )
+        else:
+            val = getattr(strategy, attribute, _MISSING)
+            if val is _MISSING:
+                # Explicitly check for None here as other "falsy" values are possible
+                if default is not None:
+                    # Defaults are shared between loads - don't hand out mutable defaults
+                    default = deepcopy(default)
+                    setattr(strategy, attribute, default)
+                    config[attribute] = default
             # None's cannot exist in the config, so do not copy them
-            if val is not None:
+            elif val is not None:
                 # max_open_trades set to -1 in the strategy will be copied as infinity in the config
                 if attribute == "max_open_trades" and val == -1:
                     config[attribute] = float("inf")
                 else:
                     config[attribute] = val
-        # Explicitly check for None here as other "falsy" values are possible
-        elif default is not None:
-            setattr(strategy, attribute, default)
-            config[attribute] = default
 
     @staticmethod
     def _normalize_attributes(strategy: IStrategy) -> IStrategy:
@@ -134,16 +170,16 @@ class StrategyResolver(IResolver):
         Normalize attributes to have the correct type.
         """
         # Sort and apply type conversions
-        if hasattr(strategy, "minimal_roi"):
+        minimal_roi = getattr(strategy, "minimal_roi", _MISSING)
+        if minimal_roi is not _MISSING:
             strategy.minimal_roi = dict(
-                sorted(
-                    {int(key): value for (key, value) in strategy.minimal_roi.items()}.items(),
-                    key=lambda t: t[0],
-                )
+                sorted(((int(key), value) for key, value in minimal_roi.items()), key=itemgetter(0))
             )
-        if hasattr(strategy, "stoploss"):
-            strategy.stoploss = float(strategy.stoploss)
-        if hasattr(strategy, "max_open_trades") and strategy.max_open_trades < 0:
+        stoploss = getattr(strategy, "stoploss", _MISSING)
+        if stoploss is not _MISSING:
+            strategy.stoploss = float(stoploss)
+        max_open_trades = getattr(strategy, "max_open_trades", _MISSING)
+        if max_open_trades is not _MISSING and max_open_trades < 0:
             strategy.max_open_trades = float("inf")
         return strategy
 
@@ -152,15 +188,17 @@ class StrategyResolver(IResolver):
         # Ensure necessary migrations are performed first.
         validate_migrated_strategy_settings(strategy.config)
 
-        if not all(k in strategy.order_types for k in REQUIRED_ORDERTYPES):
+        missing = [k for k in REQUIRED_ORDERTYPES if k not in strategy.order_types]
+        if missing:
             raise ImportError(
-                f"Impossible to load Strategy '{strategy.__class__.__name__}'. "
-                f"Order-types mapping is incomplete."
+                f"Impossible to load Strategy '{type(strategy).__name__}'. "
+                f"Order-types mapping is incomplete, missing: {missing}."
             )
-        if not all(k in strategy.order_time_in_force for k in REQUIRED_ORDERTIF):
+        missing = [k for k in REQUIRED_ORDERTIF if k not in strategy.order_time_in_force]
+        if missing:
             raise ImportError(
-                f"Impossible to load Strategy '{strategy.__class__.__name__}'. "
-                f"Order-time-in-force mapping is incomplete."
+                f"Impossible to load Strategy '{type(strategy).__name__}'. "
+                f"Order-time-in-force mapping is incomplete, missing: {missing}."
             )
         trading_mode = strategy.config.get("trading_mode", TradingMode.SPOT)
 
@@ -226,9 +264,9 @@ class StrategyResolver(IResolver):
                     "`populate_exit_trend` or `populate_sell_trend` must be implemented."
                 )
 
-            _populate_fun_len = len(getfullargspec(strategy.populate_indicators).args)
-            _buy_fun_len = len(getfullargspec(strategy.populate_buy_trend).args)
-            _sell_fun_len = len(getfullargspec(strategy.populate_sell_trend).args)
+            _populate_fun_len = len(_positional_args(strategy.populate_indicators))
+            _buy_fun_len = len(_positional_args(strategy.populate_buy_trend))
+            _sell_fun_len = len(_positional_args(strategy.populate_sell_trend))
             if any(x == 2 for x in [_populate_fun_len, _buy_fun_len, _sell_fun_len]):
                 raise OperationalException(
                     "Strategy Interface v1 is no longer supported. "
@@ -237,9 +275,9 @@ class StrategyResolver(IResolver):
                     "with the metadata argument. "
                 )
 
-        has_after_fill = "after_fill" in getfullargspec(
+        has_after_fill = "after_fill" in _positional_args(
             strategy.custom_stoploss
-        ).args and check_override(strategy, IStrategy, "custom_stoploss")
+        ) and check_override(strategy, IStrategy, "custom_stoploss")
         if has_after_fill:
             strategy._ft_stop_uses_after_fill = True
 
@@ -270,37 +308,180 @@ class StrategyResolver(IResolver):
             config, user_subdir=USERPATH_STRATEGIES, extra_dirs=extra_dirs
         )
 
-        if ":" in strategy_name:
+        name, sep, payload = strategy_name.partition(":")
+        # Only "Name:payload" is a base64 encoded strategy - payloads can't contain ":".
+        is_base64 = bool(sep) and ":" not in payload
+        if sep:
             logger.info("loading base64 encoded strategy")
-            strat = strategy_name.split(":")
-
-            if len(strat) == 2:
-                temp = Path(tempfile.mkdtemp("freq", "strategy"))
-                name = strat[0] + ".py"
-
-                temp.joinpath(name).write_text(urlsafe_b64decode(strat[1]).decode("utf-8"))
-                temp.joinpath("__init__.py").touch()
-
-                strategy_name = strat[0]
-
-                # register temp path with the bot
-                abs_paths.insert(0, temp.resolve())
-
-        strategy = StrategyResolver._load_object(
-            paths=abs_paths,
-            object_name=strategy_name,
-            add_source=True,
-            kwargs={"config": config},
-        )
+        if is_base64:
+            temp = _base64_strategy_dir(name, payload)
+
+            strategy_name = name
+
+            # register temp path with the bot
+            abs_paths.insert(0, temp)
+
+        cache_key = (strategy_name, tuple(abs_paths))
+        strategy: Optional[IStrategy] = None
+        paths_state = None
+        known_missing = False
+        if not is_base64:
+            # base64 strategies live in temporary directories - don't cache them.
+            strategy = StrategyResolver._load_cached_strategy(cache_key, config)
+            if strategy is None:
+                paths_state = _search_paths_state(abs_paths)
+                # Nothing changed since the last failed search - no need to search again.
+                known_missing = _MISSING_CACHE.get(cache_key) == paths_state
+
+        failed_modules: List[Path] = []
+        if strategy is None and not known_missing:
+            strategy = StrategyResolver._load_object(
+                paths=abs_paths,
+                object_name=strategy_name,
+                add_source=True,
+                kwargs={"config": config},
+                failed_modules=failed_modules,
+            )
+            if strategy and not is_base64:
+                entry = Path(strategy.__file__)
+                _STRATEGY_CACHE[cache_key] = (
+                    entry,
+                    _search_paths_state(_paths_until(abs_paths, entry)),
+                )
 
         if strategy:
+            _MISSING_CACHE.pop(cache_key, None)
             return StrategyResolver.validate_strategy(strategy)
 
+        _MISSING_CACHE.pop(cache_key, None)
+        if paths_state is not None and not failed_modules:
+            _MISSING_CACHE[cache_key] = paths_state
+            if len(_MISSING_CACHE) > _MISSING_CACHE_SIZE:
+                # Evict the least recently used entry
+                del _MISSING_CACHE[next(iter(_MISSING_CACHE))]
+
         raise OperationalException(
             f"Impossible to load Strategy '{strategy_name}'. This class does not exist "
             "or contains Python code errors."
         )
 
+    @staticmethod
+    def _load_cached_strategy(
+        cache_key: Tuple[str, Tuple[Path, ...]], config: Config
+    ) -> Optional[IStrategy]:
+        """
+        Load the strategy from the file it was resolved from previously.
+        Avoids searching (and importing) all files in the search paths again.
+        :param cache_key: Tuple of (strategy name, search paths)
+        :param config: configuration for the strategy
+        :return: Strategy instance or None if the strategy needs to be searched again
+        """
+        cached = _STRATEGY_CACHE.get(cache_key)
+        if cached is None:
+            return None
+        entry, paths_state = cached
+        strategy_name, search_paths = cache_key
+        strategy_class = None
+        # Files changed in the search paths up to the strategy file - search again,
+        # as the strategy may now be found in a search path with higher priority.
+        if _search_paths_state(_paths_until(list(search_paths), entry)) == paths_state:
+            strategy_class = StrategyResolver._search_object_file(
+                entry, object_name=strategy_name, add_source=True
+            )
+        if strategy_class is None:
+            _STRATEGY_CACHE.pop(cache_key, None)
+            return None
+
+        logger.info(f"Using resolved strategy {strategy_name} from '{entry.resolve()}'...")
+        return strategy_class(config=config)
+
+
+def _base64_strategy_dir(name: str, payload: str) -> Path:
+    """
+    Write a base64 encoded strategy to a temporary directory.
+    The directory is reused if the same strategy is loaded again by this process.
+    :param name: Strategy name - also used as filename
+    :param payload: base64 encoded strategy source
+    :return: Resolved path of the directory containing the strategy
+    :raises: OperationalException if the payload is not valid base64
+    """
+    # Only needed for base64 encoded strategies - import on demand
+    import atexit
+    import shutil
+    import tempfile
+    from base64 import urlsafe_b64decode
+    from hashlib import blake2b
+
+    global _B64_TEMP_ROOT
+    key = blake2b(f"{name}:{payload}".encode(), digest_size=16).hexdigest()
+    temp = _B64_TEMP_CACHE.get(key)
+    if temp is not None and temp.joinpath(name + ".py").is_file():
+        return temp
+
+    try:
+        content = urlsafe_b64decode(payload)
+    except ValueError as e:
+        # binascii.Error is a subclass of ValueError
+        raise OperationalException(
+            f"Impossible to load Strategy '{name}'. Invalid base64 encoding: {e}"
+        ) from e
+
+    if _B64_TEMP_ROOT is None or not _B64_TEMP_ROOT.is_dir():
+        _B64_TEMP_ROOT = Path(tempfile.mkdtemp(prefix="freq_strat_")).resolve()
+        atexit.register(shutil.rmtree, _B64_TEMP_ROOT, ignore_errors=True)
+
+    temp = _B64_TEMP_ROOT.joinpath(key)
+    temp.mkdir(exist_ok=True)
+    temp.joinpath(name + ".py").write_bytes(content)
+    temp.joinpath("__init__.py").touch()
+    temp = temp.resolve()
+    _B64_TEMP_CACHE[key] = temp
+    return temp
+
+
+def _search_paths_state(paths: List[Path]) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Snapshot of the python files (and their modification time and size) in the search paths,
+    including subdirectories (e.g. helper modules used by strategies).
+    Used to detect changes to the search paths since a previous strategy search.
+    """
+    state: List[Tuple[str, int, int]] = []
+    for path in paths:
+        for root, dirs, files in walk(path):
+            # Skip __pycache__ and hidden directories
+            dirs[:] = [d for d in dirs if not d.startswith(("__", "."))]
+            for file in files:
+                if file.endswith(".py"):
+                    file_path = Path(root, file)
+                    try:
+                        st = file_path.stat()
+                        # Size helps to detect edits on filesystems with coarse timestamps
+                        state.append((str(file_path), st.st_mtime_ns, st.st_size))
+                    except OSError:
+                        state.append((str(file_path), -1, -1))
+    return tuple(state)
+
+
+def _paths_until(paths: List[Path], entry: Path) -> List[Path]:
+    """
+    Search paths up to (and including) the directory containing entry.
+    """
+    for idx, path in enumerate(paths):
+        if path == entry.parent:
+            return paths[: idx + 1]
+    return paths
+
+
+def _positional_args(fn: Callable) -> Tuple[str, ...]:
+    """
+    Names of the positional arguments of fn (including self for methods).
+    Same as getfullargspec(fn).args, but reads the code object directly where possible.
+    """
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return tuple(getfullargspec(fn).args)
+    return code.co_varnames[: code.co_argcount]
+
 
 def warn_deprecated_setting(strategy: IStrategy, old: str, new: str, error=False):
     if hasattr(strategy, old):
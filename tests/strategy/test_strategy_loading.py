@@ -1,6 +1,10 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 import logging
+import os
+import shutil
+import sys
 from base64 import urlsafe_b64encode
+from functools import partial
 from pathlib import Path
 
 import pytest
@@ -8,7 +12,8 @@ from pandas import DataFrame
 
 from freqtrade.configuration import Configuration
 from freqtrade.exceptions import OperationalException
-from freqtrade.resolvers import StrategyResolver
+from freqtrade.resolvers import StrategyResolver, strategy_resolver
+from freqtrade.resolvers.strategy_resolver import _positional_args
 from freqtrade.strategy.interface import IStrategy
 from tests.conftest import CURRENT_TEST_STRATEGY, log_has, log_has_re
 
@@ -84,6 +89,195 @@ def test_load_strategy_base64(dataframe_1m, caplog, default_conf):
     )
 
 
+@pytest.mark.parametrize(
+    "strategy_name,match",
+    [
+        ("Foo:abc", r"Impossible to load Strategy 'Foo'. Invalid base64 encoding.*"),
+        ("Foo:abc:def", r"Impossible to load Strategy 'Foo:abc:def'. This class does not exist.*"),
+        ("Foo:Zm9v:YmFy", r"Impossible to load Strategy 'Foo:Zm9v:YmFy'. This class does not.*"),
+    ],
+)
+def test_load_strategy_base64_invalid(default_conf, tmp_path, strategy_name, match):
+    default_conf["user_data_dir"] = tmp_path
+    with pytest.raises(OperationalException, match=match):
+        StrategyResolver._load_strategy(strategy_name, config=default_conf)
+
+
+def test_load_strategy_base64_reuse_tempdir(default_conf, mocker):
+    mocker.patch.dict(strategy_resolver._B64_TEMP_CACHE, clear=True)
+    mocker.patch.object(strategy_resolver, "_B64_TEMP_ROOT", None)
+    filepath = Path(__file__).parents[2] / "freqtrade/templates/sample_strategy.py"
+    encoded_string = urlsafe_b64encode(filepath.read_bytes()).decode("utf-8")
+    default_conf.update({"strategy": f"SampleStrategy:{encoded_string}"})
+
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy_file = Path(strategy.__file__)
+    assert strategy_file.parent.parent == strategy_resolver._B64_TEMP_ROOT
+
+    # Same strategy reuses the temporary directory
+    strategy2 = StrategyResolver.load_strategy(default_conf)
+    assert Path(strategy2.__file__) == strategy_file
+
+    # Removed file is written again
+    strategy_file.unlink()
+    strategy3 = StrategyResolver.load_strategy(default_conf)
+    assert Path(strategy3.__file__) == strategy_file
+    assert strategy_file.is_file()
+
+    # Different strategy content uses a new directory within the same root
+    encoded_string = urlsafe_b64encode(filepath.read_bytes() + b"\n").decode("utf-8")
+    default_conf.update({"strategy": f"SampleStrategy:{encoded_string}"})
+    strategy4 = StrategyResolver.load_strategy(default_conf)
+    assert Path(strategy4.__file__).parent != strategy_file.parent
+    assert Path(strategy4.__file__).parent.parent == strategy_resolver._B64_TEMP_ROOT
+
+
+def test_load_strategy_cached(default_conf, mocker, caplog, tmp_path):
+    mocker.patch.dict(strategy_resolver._STRATEGY_CACHE, clear=True)
+    mocker.patch.dict(strategy_resolver._MISSING_CACHE, clear=True)
+    search_mock = mocker.spy(StrategyResolver, "_search_object")
+    shutil.copy(Path(__file__).parent / "strats/strategy_test_v3.py", tmp_path)
+    default_conf.update({"strategy": CURRENT_TEST_STRATEGY, "strategy_path": str(tmp_path)})
+
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert search_mock.call_count == 1
+    assert len(strategy_resolver._STRATEGY_CACHE) == 1
+
+    caplog.clear()
+    strategy2 = StrategyResolver.load_strategy(default_conf)
+    # Loaded from the cached location - no search necessary
+    assert search_mock.call_count == 1
+    assert log_has_re(r"Using resolved strategy StrategyTestV3 from .*strategy_test_v3\.py", caplog)
+    assert strategy2.__file__ == strategy.__file__
+    assert "class StrategyTestV3" in strategy2.__source__
+    # Every load uses a freshly imported class
+    assert type(strategy2) is not type(strategy)
+
+    # Removed file invalidates the cache entry
+    (tmp_path / "strategy_test_v3.py").unlink()
+    with pytest.raises(OperationalException, match=r"Impossible to load Strategy.*"):
+        StrategyResolver.load_strategy(default_conf)
+    assert len(strategy_resolver._STRATEGY_CACHE) == 0
+
+
+def test_load_strategy_cached_search_order(default_conf, mocker, tmp_path):
+    mocker.patch.dict(strategy_resolver._STRATEGY_CACHE, clear=True)
+    mocker.patch.dict(strategy_resolver._MISSING_CACHE, clear=True)
+    strategy_file = Path(__file__).parent / "strats/strategy_test_v3.py"
+    low_dir = tmp_path / "strategies"
+    high_dir = tmp_path / "high"
+    low_dir.mkdir()
+    high_dir.mkdir()
+    shutil.copy(strategy_file, low_dir / "low.py")
+    default_conf.update(
+        {
+            "strategy": CURRENT_TEST_STRATEGY,
+            "strategy_path": str(high_dir),
+            "user_data_dir": tmp_path,
+        }
+    )
+
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert Path(strategy.__file__) == low_dir / "low.py"
+    assert len(strategy_resolver._STRATEGY_CACHE) == 1
+
+    # Strategy in a search path with higher priority wins, as without the cache
+    shutil.copy(strategy_file, high_dir / "high.py")
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert Path(strategy.__file__) == high_dir / "high.py"
+
+
+def test_load_not_found_strategy_cached(default_conf, mocker, tmp_path):
+    mocker.patch.dict(strategy_resolver._STRATEGY_CACHE, clear=True)
+    mocker.patch.dict(strategy_resolver._MISSING_CACHE, clear=True)
+    search_mock = mocker.spy(StrategyResolver, "_search_object")
+    default_conf.update(
+        {
+            "strategy": CURRENT_TEST_STRATEGY,
+            "strategy_path": str(tmp_path),
+            "user_data_dir": tmp_path,
+        }
+    )
+
+    with pytest.raises(OperationalException, match=r"Impossible to load Strategy.*"):
+        StrategyResolver.load_strategy(default_conf)
+    assert len(strategy_resolver._MISSING_CACHE) == 1
+    call_count = search_mock.call_count
+    assert call_count > 0
+
+    # Search paths did not change - no new search
+    with pytest.raises(OperationalException, match=r"Impossible to load Strategy.*"):
+        StrategyResolver.load_strategy(default_conf)
+    assert search_mock.call_count == call_count
+
+    # Changed helper modules in subdirectories invalidate the cached result
+    (tmp_path / "helpers").mkdir()
+    (tmp_path / "helpers" / "helper.py").write_text("")
+    with pytest.raises(OperationalException, match=r"Impossible to load Strategy.*"):
+        StrategyResolver.load_strategy(default_conf)
+    assert search_mock.call_count > call_count
+    call_count = search_mock.call_count
+
+    # New file in the search path invalidates the cached result
+    shutil.copy(Path(__file__).parent / "strats/strategy_test_v3.py", tmp_path)
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert isinstance(strategy, IStrategy)
+    assert search_mock.call_count > call_count
+    assert len(strategy_resolver._MISSING_CACHE) == 0
+
+
+def test_load_not_found_strategy_missing_dependency(default_conf, mocker, tmp_path, caplog):
+    mocker.patch.dict(strategy_resolver._STRATEGY_CACHE, clear=True)
+    mocker.patch.dict(strategy_resolver._MISSING_CACHE, clear=True)
+    mocker.patch.dict(sys.modules)
+    strategy_dir = tmp_path / "strategies"
+    lib_dir = tmp_path / "lib"
+    strategy_dir.mkdir()
+    source = (Path(__file__).parent / "strats/strategy_test_v3.py").read_text()
+    (strategy_dir / "strategy_test_v3.py").write_text("import mylib_xyz  # noqa\n" + source)
+    default_conf.update(
+        {
+            "strategy": CURRENT_TEST_STRATEGY,
+            "strategy_path": str(strategy_dir),
+            "user_data_dir": tmp_path,
+        }
+    )
+
+    with pytest.raises(OperationalException, match=r"Impossible to load Strategy.*"):
+        StrategyResolver.load_strategy(default_conf)
+    assert log_has_re(r"Could not import .*strategy_test_v3\.py due to .*mylib_xyz.*", caplog)
+    # Failed imports are not cached
+    assert len(strategy_resolver._MISSING_CACHE) == 0
+
+    caplog.clear()
+    with pytest.raises(OperationalException, match=r"Impossible to load Strategy.*"):
+        StrategyResolver.load_strategy(default_conf)
+    assert log_has_re(r"Could not import .*strategy_test_v3\.py due to .*mylib_xyz.*", caplog)
+
+    # Dependency becomes available
+    lib_dir.mkdir()
+    (lib_dir / "mylib_xyz.py").write_text("")
+    mocker.patch.object(sys, "path", [str(lib_dir)] + sys.path)
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert isinstance(strategy, IStrategy)
+
+
+def test_search_paths_state(tmp_path):
+    helper = tmp_path / "helpers" / "helper.py"
+    helper.parent.mkdir()
+    helper.write_text("a = 1\n")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "ignored.py").write_text("")
+    state = strategy_resolver._search_paths_state([tmp_path])
+    assert state == ((str(helper), helper.stat().st_mtime_ns, 6),)
+
+    # Edit within the same timestamp tick (coarse filesystem timestamps)
+    mtime_ns = helper.stat().st_mtime_ns
+    helper.write_text("a = 12\n")
+    os.utime(helper, ns=(mtime_ns, mtime_ns))
+    assert strategy_resolver._search_paths_state([tmp_path]) != state
+
+
 def test_load_strategy_invalid_directory(caplog, default_conf, tmp_path):
     default_conf["user_data_dir"] = tmp_path
 
@@ -191,6 +385,21 @@ def test_strategy_override_max_open_trades(caplog, default_conf):
     assert log_has("Override strategy 'max_open_trades' with value in config file: 7.", caplog)
 
 
+def test_strategy_using_attributes_log(caplog, default_conf, mocker):
+    default_conf.update({"strategy": CURRENT_TEST_STRATEGY, "stoploss": -0.5})
+    caplog.set_level(logging.WARNING)
+    info_mock = mocker.spy(strategy_resolver.logger, "info")
+    StrategyResolver.load_strategy(default_conf)
+    assert not log_has_re(r"Strategy using .*", caplog)
+    assert not [c for c in info_mock.call_args_list if "Override strategy" in c[0][0]]
+    assert not [c for c in info_mock.call_args_list if "Strategy using" in c[0][0]]
+
+    caplog.set_level(logging.INFO)
+    StrategyResolver.load_strategy(default_conf)
+    assert log_has("Strategy using stoploss: -0.5", caplog)
+    assert log_has("Strategy using max_open_trades: 1", caplog)
+
+
 def test_strategy_override_trailing_stop(caplog, default_conf):
     caplog.set_level(logging.INFO)
     default_conf.update({"strategy": CURRENT_TEST_STRATEGY, "trailing_stop": True})
@@ -276,7 +485,8 @@ def test_strategy_override_order_types(caplog, default_conf):
     with pytest.raises(
         ImportError,
         match=r"Impossible to load Strategy '" + CURRENT_TEST_STRATEGY + "'. "
-        r"Order-types mapping is incomplete.",
+        r"Order-types mapping is incomplete, missing: \['entry', 'stoploss', "
+        r"'stoploss_on_exchange'\].",
     ):
         StrategyResolver.load_strategy(default_conf)
 
@@ -311,7 +521,7 @@ def test_strategy_override_order_tif(caplog, default_conf):
     with pytest.raises(
         ImportError,
         match=f"Impossible to load Strategy '{CURRENT_TEST_STRATEGY}'. "
-        "Order-time-in-force mapping is incomplete.",
+        r"Order-time-in-force mapping is incomplete, missing: \['exit'\].",
     ):
         StrategyResolver.load_strategy(default_conf)
 
@@ -370,6 +580,50 @@ def test_strategy_override_use_exit_profit_only(caplog, default_conf):
     assert log_has("Override strategy 'exit_profit_only' with value in config file: True.", caplog)
 
 
+def test_override_attribute_helper():
+    class Strat:
+        stoploss = -0.1
+        timeframe = None
+
+        @property
+        def stake_currency(self):
+            return "BTC"
+
+    strategy = Strat()
+    config = {"stake_currency": "USDT"}
+    for attribute, default in [
+        ("stoploss", None),
+        ("timeframe", "5m"),
+        ("stake_currency", None),
+        ("use_exit_signal", True),
+        ("minimal_roi", {"0": 10.0}),
+    ]:
+        StrategyResolver._override_attribute_helper(strategy, config, attribute, default)
+
+    assert config == {
+        # Properties are not overwritten, but copied to the config
+        "stake_currency": "BTC",
+        "stoploss": -0.1,
+        "use_exit_signal": True,
+        "minimal_roi": {"0": 10.0},
+    }
+    # None in the strategy is kept
+    assert strategy.timeframe is None
+    assert strategy.use_exit_signal is True
+
+    # Mutable defaults are not shared between strategies
+    default_roi = {"0": 10.0}
+    strategy2 = Strat()
+    StrategyResolver._override_attribute_helper(strategy2, {}, "minimal_roi", default_roi)
+    strategy2.minimal_roi["0"] = 0.5
+    assert default_roi == {"0": 10.0}
+    strategy.minimal_roi["0"] = 0.5
+
+    StrategyResolver._normalize_attributes(strategy)
+    assert strategy.minimal_roi == {0: 0.5}
+    assert strategy.stoploss == -0.1
+
+
 def test_strategy_max_open_trades_infinity_from_strategy(caplog, default_conf):
     caplog.set_level(logging.INFO)
     default_conf.update(
@@ -504,3 +758,18 @@ def test_strategy_ft_load_params_from_file(mocker, default_conf):
     strategy = StrategyResolver.load_strategy(default_conf)
     assert strategy.max_open_trades == float("inf")
     assert strategy.config["max_open_trades"] == float("inf")
+
+
+def test_positional_args(default_conf):
+    default_conf.update({"strategy": CURRENT_TEST_STRATEGY})
+    strategy = StrategyResolver.load_strategy(default_conf)
+
+    assert _positional_args(strategy.populate_indicators) == ("self", "dataframe", "metadata")
+    assert "after_fill" in _positional_args(strategy.custom_stoploss)
+
+    def func(a, b, *args, c=1, **kwargs):
+        pass
+
+    assert _positional_args(func) == ("a", "b")
+    # Callables without code object
+    assert _positional_args(partial(func, 1)) == ("b",)